@@ -12,7 +12,6 @@ from .const import DOMAIN
 from .coordinator import VDAIRBoardCoordinator
 from .services import async_setup_services
 from .api import async_setup_api
-from .storage import get_storage
 from .profile_manager import get_profile_manager
 
 _LOGGER: logging.Logger = logging.getLogger(__name__)
@@ -24,13 +23,9 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the VDA IR Control component."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Initialize profile manager and load cached community profiles
-    profile_manager = get_profile_manager(hass)
-    await profile_manager.async_load()
-    _LOGGER.debug(
-        "Profile manager initialized: %d community profiles cached",
-        len(profile_manager.get_all_community_profiles())
-    )
+    # Create the profile manager; cached community profiles are loaded
+    # on first use (every consumer awaits async_load() before reading)
+    get_profile_manager(hass)
 
     # Register services
     await async_setup_services(hass)
@@ -1,7 +1,6 @@
 """REST API endpoints for VDA IR Control."""
 
 import logging
-from aiohttp import web
 
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
@@ -24,8 +23,6 @@ from .ir_profiles import (
     get_profiles_by_type,
     get_profiles_by_manufacturer,
     get_profile_by_id,
-    get_available_manufacturers,
-    get_available_device_types,
 )
 from .profile_manager import get_profile_manager
 from .models import SerialDevice, SerialConfig, DeviceCommand, ResponsePattern
@@ -465,18 +462,16 @@ class VDAIRBuiltinProfilesView(HomeAssistantView):
             builtin_profiles = get_all_profiles()
 
         # Get community profiles and filter if needed
-        community_profiles = manager.get_all_community_profiles()
-
         if device_type:
-            community_profiles = [
-                p for p in community_profiles
-                if p.get("device_type") == device_type
-            ]
+            community_profiles = manager.get_community_profiles_by_type(device_type)
+        else:
+            community_profiles = manager.get_all_community_profiles()
 
         if manufacturer:
+            manufacturer_lower = manufacturer.lower()
             community_profiles = [
                 p for p in community_profiles
-                if p.get("manufacturer", "").lower() == manufacturer.lower()
+                if p.get("manufacturer", "").lower() == manufacturer_lower
             ]
 
         # Merge profiles with deduplication by profile_id
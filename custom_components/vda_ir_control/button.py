@@ -1,11 +1,13 @@
 """Button platform for VDA IR Control devices."""
 
+import asyncio
+import functools
 import logging
 from typing import Any
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -19,57 +21,57 @@ _LOGGER = logging.getLogger(__name__)
 # Command display names and icons
 COMMAND_INFO = {
     # Power
-    "power": {"name": "Power", "icon": "mdi:power"},
-    "power_on": {"name": "Power On", "icon": "mdi:power-on"},
-    "power_off": {"name": "Power Off", "icon": "mdi:power-off"},
-    "power_toggle": {"name": "Power Toggle", "icon": "mdi:power"},
+    "power": ("Power", "mdi:power"),
+    "power_on": ("Power On", "mdi:power-on"),
+    "power_off": ("Power Off", "mdi:power-off"),
+    "power_toggle": ("Power Toggle", "mdi:power"),
     # Volume
-    "volume_up": {"name": "Volume Up", "icon": "mdi:volume-plus"},
-    "volume_down": {"name": "Volume Down", "icon": "mdi:volume-minus"},
-    "mute": {"name": "Mute", "icon": "mdi:volume-mute"},
+    "volume_up": ("Volume Up", "mdi:volume-plus"),
+    "volume_down": ("Volume Down", "mdi:volume-minus"),
+    "mute": ("Mute", "mdi:volume-mute"),
     # Channel
-    "channel_up": {"name": "Channel Up", "icon": "mdi:chevron-up"},
-    "channel_down": {"name": "Channel Down", "icon": "mdi:chevron-down"},
+    "channel_up": ("Channel Up", "mdi:chevron-up"),
+    "channel_down": ("Channel Down", "mdi:chevron-down"),
     # Navigation
-    "up": {"name": "Up", "icon": "mdi:chevron-up"},
-    "down": {"name": "Down", "icon": "mdi:chevron-down"},
-    "left": {"name": "Left", "icon": "mdi:chevron-left"},
-    "right": {"name": "Right", "icon": "mdi:chevron-right"},
-    "enter": {"name": "Enter", "icon": "mdi:checkbox-blank-circle"},
-    "select": {"name": "Select", "icon": "mdi:checkbox-blank-circle"},
-    "back": {"name": "Back", "icon": "mdi:arrow-left"},
-    "exit": {"name": "Exit", "icon": "mdi:exit-to-app"},
-    "menu": {"name": "Menu", "icon": "mdi:menu"},
-    "home": {"name": "Home", "icon": "mdi:home"},
-    "guide": {"name": "Guide", "icon": "mdi:television-guide"},
-    "info": {"name": "Info", "icon": "mdi:information"},
+    "up": ("Up", "mdi:chevron-up"),
+    "down": ("Down", "mdi:chevron-down"),
+    "left": ("Left", "mdi:chevron-left"),
+    "right": ("Right", "mdi:chevron-right"),
+    "enter": ("Enter", "mdi:checkbox-blank-circle"),
+    "select": ("Select", "mdi:checkbox-blank-circle"),
+    "back": ("Back", "mdi:arrow-left"),
+    "exit": ("Exit", "mdi:exit-to-app"),
+    "menu": ("Menu", "mdi:menu"),
+    "home": ("Home", "mdi:home"),
+    "guide": ("Guide", "mdi:television-guide"),
+    "info": ("Info", "mdi:information"),
     # Numbers
-    "0": {"name": "0", "icon": "mdi:numeric-0"},
-    "1": {"name": "1", "icon": "mdi:numeric-1"},
-    "2": {"name": "2", "icon": "mdi:numeric-2"},
-    "3": {"name": "3", "icon": "mdi:numeric-3"},
-    "4": {"name": "4", "icon": "mdi:numeric-4"},
-    "5": {"name": "5", "icon": "mdi:numeric-5"},
-    "6": {"name": "6", "icon": "mdi:numeric-6"},
-    "7": {"name": "7", "icon": "mdi:numeric-7"},
-    "8": {"name": "8", "icon": "mdi:numeric-8"},
-    "9": {"name": "9", "icon": "mdi:numeric-9"},
+    "0": ("0", "mdi:numeric-0"),
+    "1": ("1", "mdi:numeric-1"),
+    "2": ("2", "mdi:numeric-2"),
+    "3": ("3", "mdi:numeric-3"),
+    "4": ("4", "mdi:numeric-4"),
+    "5": ("5", "mdi:numeric-5"),
+    "6": ("6", "mdi:numeric-6"),
+    "7": ("7", "mdi:numeric-7"),
+    "8": ("8", "mdi:numeric-8"),
+    "9": ("9", "mdi:numeric-9"),
     # Inputs
-    "source": {"name": "Source", "icon": "mdi:video-input-hdmi"},
-    "hdmi": {"name": "HDMI", "icon": "mdi:video-input-hdmi"},
-    "hdmi1": {"name": "HDMI 1", "icon": "mdi:video-input-hdmi"},
-    "hdmi2": {"name": "HDMI 2", "icon": "mdi:video-input-hdmi"},
-    "hdmi3": {"name": "HDMI 3", "icon": "mdi:video-input-hdmi"},
-    "hdmi4": {"name": "HDMI 4", "icon": "mdi:video-input-hdmi"},
+    "source": ("Source", "mdi:video-input-hdmi"),
+    "hdmi": ("HDMI", "mdi:video-input-hdmi"),
+    "hdmi1": ("HDMI 1", "mdi:video-input-hdmi"),
+    "hdmi2": ("HDMI 2", "mdi:video-input-hdmi"),
+    "hdmi3": ("HDMI 3", "mdi:video-input-hdmi"),
+    "hdmi4": ("HDMI 4", "mdi:video-input-hdmi"),
     # Playback
-    "play": {"name": "Play", "icon": "mdi:play"},
-    "pause": {"name": "Pause", "icon": "mdi:pause"},
-    "play_pause": {"name": "Play/Pause", "icon": "mdi:play-pause"},
-    "stop": {"name": "Stop", "icon": "mdi:stop"},
-    "rewind": {"name": "Rewind", "icon": "mdi:rewind"},
-    "fast_forward": {"name": "Fast Forward", "icon": "mdi:fast-forward"},
-    "record": {"name": "Record", "icon": "mdi:record"},
-    "replay": {"name": "Replay", "icon": "mdi:replay"},
+    "play": ("Play", "mdi:play"),
+    "pause": ("Pause", "mdi:pause"),
+    "play_pause": ("Play/Pause", "mdi:play-pause"),
+    "stop": ("Stop", "mdi:stop"),
+    "rewind": ("Rewind", "mdi:rewind"),
+    "fast_forward": ("Fast Forward", "mdi:fast-forward"),
+    "record": ("Record", "mdi:record"),
+    "replay": ("Replay", "mdi:replay"),
 }
 
 # Device type icons
@@ -83,6 +85,12 @@ DEVICE_TYPE_ICONS = {
     "projector": "mdi:projector",
 }
 
+# Device registry model names, derived once from the known device types
+_DEVICE_TYPE_MODEL_NAMES = {
+    device_type: device_type.replace("_", " ").title()
+    for device_type in DEVICE_TYPE_ICONS
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -99,21 +107,40 @@ async def async_setup_entry(
     # Get all controlled devices
     devices = await storage.async_get_all_devices()
 
+    # Only create entities for devices using this board
+    devices = [d for d in devices if d.board_id == coordinator.board_id]
+
+    # Resolve each distinct profile once, even when several devices share it.
+    # dict.fromkeys keeps the device order so lookups run in a stable order.
+    profile_ids = list(dict.fromkeys(d.device_profile_id for d in devices))
+    resolved = dict(
+        zip(
+            profile_ids,
+            await asyncio.gather(
+                *(_resolve_profile(hass, profile_id) for profile_id in profile_ids)
+            ),
+        )
+    )
+
     entities = []
+    entity_counts: dict[str, int] = {}
     for device in devices:
-        # Only create entities for devices using this board
-        if device.board_id != coordinator.board_id:
-            continue
-
-        # Get commands from profile
-        commands = await _get_device_commands(hass, device.device_profile_id)
+        commands, device_type = resolved[device.device_profile_id]
 
         if not commands:
             _LOGGER.warning("No commands found for device %s", device.device_id)
             continue
 
-        # Get device type for icon
-        device_type = await _get_device_type(hass, device.device_profile_id)
+        # Device info - groups all buttons under one device
+        device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"controlled_{device.device_id}")},
+            name=device.name,
+            manufacturer="VDA IR Control",
+            model=_DEVICE_TYPE_MODEL_NAMES.get(device_type)
+            or device_type.replace("_", " ").title(),
+            suggested_area=device.location or None,
+            via_device=(DOMAIN, device.board_id),
+        )
 
         # Create a button entity for each command
         for command, code_info in commands.items():
@@ -124,56 +151,54 @@ async def async_setup_entry(
                     command=command,
                     code_info=code_info,
                     device_type=device_type,
+                    device_info=device_info,
                 )
             )
 
-        _LOGGER.info(
-            "Created %d button entities for device %s",
-            len(commands),
-            device.device_id,
-        )
+        entity_counts[device.device_id] = len(commands)
 
     if entities:
         async_add_entities(entities)
+        _LOGGER.debug(
+            "Created %d button entities across %d devices",
+            len(entities),
+            len(entity_counts),
+        )
 
 
-async def _get_device_commands(hass: HomeAssistant, profile_id: str) -> dict:
-    """Get commands from a profile (builtin or custom)."""
+async def _resolve_profile(hass: HomeAssistant, profile_id: str) -> tuple[dict, str]:
+    """Get commands and device type from a profile (builtin or custom)."""
     if profile_id.startswith("builtin:"):
         builtin_id = profile_id[8:]
         profile = get_builtin_profile(builtin_id)
         if profile:
             # Return codes with protocol info
-            return {
-                cmd: {"code": code, "protocol": profile.get("protocol", "NEC")}
+            protocol = profile.get("protocol", "NEC")
+            commands = {
+                cmd: {"code": code, "protocol": protocol}
                 for cmd, code in profile.get("codes", {}).items()
             }
-        return {}
+            return commands, profile.get("device_type", "tv")
+        return {}, "tv"
     else:
         storage = get_storage(hass)
         profile = await storage.async_get_profile(profile_id)
         if profile:
-            return {
+            commands = {
                 cmd: {"code": ir_code.raw_code, "protocol": ir_code.protocol}
                 for cmd, ir_code in profile.codes.items()
             }
-        return {}
+            return commands, profile.device_type.value
+        return {}, "tv"
 
 
-async def _get_device_type(hass: HomeAssistant, profile_id: str) -> str:
-    """Get device type from a profile."""
-    if profile_id.startswith("builtin:"):
-        builtin_id = profile_id[8:]
-        profile = get_builtin_profile(builtin_id)
-        if profile:
-            return profile.get("device_type", "tv")
-        return "tv"
-    else:
-        storage = get_storage(hass)
-        profile = await storage.async_get_profile(profile_id)
-        if profile:
-            return profile.device_type.value
-        return "tv"
+@functools.cache
+def _command_info(command: str) -> tuple[str, str]:
+    """Get the display name and icon for a command."""
+    info = COMMAND_INFO.get(command)
+    if info is None:
+        return command.replace("_", " ").title(), "mdi:remote"
+    return info
 
 
 class VDAIRCommandButton(CoordinatorEntity, ButtonEntity):
@@ -186,35 +211,29 @@ class VDAIRCommandButton(CoordinatorEntity, ButtonEntity):
         command: str,
         code_info: dict,
         device_type: str,
+        device_info: DeviceInfo,
     ) -> None:
         """Initialize the button."""
         super().__init__(coordinator)
         self._device = device
+        self._device_id = device.device_id
+        self._port = device.output_port
+        self._send = coordinator.send_ir_code
         self._command = command
         self._code = code_info.get("code", "")
         self._protocol = code_info.get("protocol", "NEC")
         self._device_type = device_type
 
         # Get command display info
-        cmd_info = COMMAND_INFO.get(command, {})
-        self._cmd_name = cmd_info.get("name", command.replace("_", " ").title())
-        self._cmd_icon = cmd_info.get("icon", "mdi:remote")
+        self._cmd_name, self._cmd_icon = _command_info(command)
 
         # Entity attributes
         self._attr_unique_id = f"vda_ir_{device.device_id}_{command}"
         self._attr_name = f"{device.name} {self._cmd_name}"
         self._attr_icon = self._cmd_icon
 
-        # Device info - groups all buttons under one device
-        device_icon = DEVICE_TYPE_ICONS.get(device_type, "mdi:remote")
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"controlled_{device.device_id}")},
-            name=device.name,
-            manufacturer="VDA IR Control",
-            model=device_type.replace("_", " ").title(),
-            suggested_area=device.location if device.location else None,
-            via_device=(DOMAIN, device.board_id),
-        )
+        # Shared with every other button of the same controlled device
+        self._attr_device_info = device_info
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
@@ -229,22 +248,19 @@ class VDAIRCommandButton(CoordinatorEntity, ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle button press - send IR command."""
-        _LOGGER.debug(
-            "Sending %s command to %s via GPIO %d",
-            self._command,
-            self._device.device_id,
-            self._device.output_port,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Sending %s command to %s via GPIO %d",
+                self._command,
+                self._device_id,
+                self._port,
+            )
 
-        success = await self.coordinator.send_ir_code(
-            self._device.output_port,
-            self._code,
-            self._protocol,
-        )
+        success = await self._send(self._port, self._code, self._protocol)
 
         if not success:
             _LOGGER.error(
                 "Failed to send %s command to %s",
                 self._command,
-                self._device.device_id,
+                self._device_id,
             )
@@ -2,32 +2,63 @@
 
 import asyncio
 import logging
+from itertools import islice
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.service_info.zeroconf import ZeroconfServiceInfo
+from homeassistant.util.json import json_loads
 
 from .const import DOMAIN
+from .coordinator import async_get_local_subnet, create_scan_connector, probe_port
 
 _LOGGER = logging.getLogger(__name__)
 
 # Discovery timeout per IP
 DISCOVERY_TIMEOUT = 2
 
+# Discovery results are reused across flow restarts for a short time,
+# cached under this key in hass.data[DOMAIN]
+DISCOVERY_CACHE_KEY = "discovery_cache"
+DISCOVERY_CACHE_TTL = 10.0
+
+# Common subnet ranges - 192.168.4.x first since ESP32s often use this
+DEFAULT_SUBNETS = ("192.168.4", "192.168.1", "192.168.0", "10.0.0")
+
+# Maximum number of IPs scanned across the default subnets
+DISCOVERY_MAX_IPS = 300
+
+# Static form schemas
+ZEROCONF_CONFIRM_SCHEMA = vol.Schema({})
+
+MANUAL_SCHEMA = vol.Schema({
+    vol.Required("ip_address"): str,
+})
+
+# Maximum number of IPs probed at once during discovery
+DISCOVERY_CONCURRENCY = 50
+
+
+def _default_board_id(board_info: dict[str, Any]) -> str:
+    """Return the board_id to suggest when adopting a board."""
+    current_id = board_info.get("board_id", "")
+    if current_id and not current_id.startswith("ir-"):
+        return current_id
+    # Create a friendly default ID from MAC last 6 chars
+    mac_suffix = board_info["mac_address"].replace(":", "")[-6:].lower()
+    return f"ir_board_{mac_suffix}"
+
 
 class VdaIrControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle config flow for VDA IR Control."""
 
     VERSION = 1
 
-    def __init__(self) -> None:
-        """Initialize the config flow."""
-        self.discovered_boards: dict[str, dict[str, Any]] = {}
-
     async def async_step_zeroconf(
         self, discovery_info: ZeroconfServiceInfo
     ) -> FlowResult:
@@ -64,7 +95,7 @@ class VdaIrControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show confirmation form
         return self.async_show_form(
             step_id="zeroconf_confirm",
-            data_schema=vol.Schema({}),
+            data_schema=ZEROCONF_CONFIRM_SCHEMA,
             description_placeholders={
                 "name": board_name,
                 "ip": host,
@@ -102,7 +133,7 @@ class VdaIrControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Show form again
         return self.async_show_form(
             step_id="zeroconf_confirm",
-            data_schema=vol.Schema({}),
+            data_schema=ZEROCONF_CONFIRM_SCHEMA,
             description_placeholders={
                 "name": board_info.get("board_name", "IR Board"),
                 "ip": board_info.get("ip_address", "Unknown"),
@@ -118,27 +149,32 @@ class VdaIrControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             selected = user_input.get("board")
+            discovered_boards = self.context.get("discovered_boards", {})
             if selected == "_manual_":
+                self.context.pop("discovered_boards", None)
                 return await self.async_step_manual()
-            elif selected and selected in self.discovered_boards:
-                self.context["board_info"] = self.discovered_boards[selected]
+            elif selected and selected in discovered_boards:
+                self.context["board_info"] = discovered_boards[selected]
+                # Release the other candidates before adoption
+                self.context.pop("discovered_boards", None)
                 return await self.async_step_adopt()
             errors["base"] = "no_board_selected"
 
         # Perform discovery
-        self.discovered_boards = await self._discover_boards()
+        discovered_boards = await self._discover_boards()
+        self.context["discovered_boards"] = discovered_boards
 
         # Build selection options - discovered boards + manual option
         board_options = {}
-        for mac, info in self.discovered_boards.items():
+        for mac, info in discovered_boards.items():
             board_options[mac] = f"{info.get('board_name', 'Unknown')} ({info.get('ip_address', 'Unknown IP')})"
 
         # Always add manual option at the end
         board_options["_manual_"] = "Enter IP address manually..."
 
         # Determine description based on discovery results
-        if self.discovered_boards:
-            description = f"Found {len(self.discovered_boards)} board(s) on your network. Select one to add, or enter an IP manually."
+        if discovered_boards:
+            description = f"Found {len(discovered_boards)} board(s) on your network. Select one to add, or enter an IP manually."
         else:
             description = "No boards found on the network. Enter an IP address manually."
 
@@ -165,6 +201,8 @@ class VdaIrControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 # Try to connect to the board
                 board_info = await self._check_board(ip_address)
                 if board_info:
+                    # A board the scan missed is online; rescan next time
+                    self.hass.data.get(DOMAIN, {}).pop(DISCOVERY_CACHE_KEY, None)
                     self.context["board_info"] = board_info
                     return await self.async_step_adopt()
                 errors["base"] = "cannot_connect"
@@ -173,11 +211,7 @@ class VdaIrControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="manual",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("ip_address"): str,
-                }
-            ),
+            data_schema=MANUAL_SCHEMA,
             errors=errors,
         )
 
@@ -227,13 +261,7 @@ class VdaIrControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     )
                 errors["base"] = "adoption_failed"
 
-        # Generate a default board_id from MAC if not set
-        if not current_id or current_id.startswith("ir-"):
-            # Create a friendly default ID from MAC last 6 chars
-            mac_suffix = mac_address.replace(":", "")[-6:].lower()
-            default_id = f"ir_board_{mac_suffix}"
-        else:
-            default_id = current_id
+        default_id = board_info.get("default_board_id", current_id or "ir_board")
 
         return self.async_show_form(
             step_id="adopt",
@@ -252,46 +280,90 @@ class VdaIrControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _discover_boards(self) -> dict[str, dict[str, Any]]:
         """Discover IR boards on the network."""
+        loop = asyncio.get_running_loop()
+        cache = self.hass.data.setdefault(DOMAIN, {}).setdefault(DISCOVERY_CACHE_KEY, {})
+        if cache.get("expires", 0) > loop.time():
+            return cache["boards"]
+
         boards = {}
-        session = async_get_clientsession(self.hass)
 
-        # IPs to scan - prioritize 192.168.4.x (common for ESP32 AP/WiFi)
+        # IPs to scan - Home Assistant's own subnet first, using the subnet
+        # detection cached in hass.data, then the defaults
         ips_to_scan = []
-
-        # Add common subnet ranges - 192.168.4.x first since ESP32s often use this
-        for subnet in ["192.168.4", "192.168.1", "192.168.0", "10.0.0"]:
+        max_ips = DISCOVERY_MAX_IPS
+        subnets = list(DEFAULT_SUBNETS)
+        local_subnet = await async_get_local_subnet(self.hass)
+        if local_subnet is not None and local_subnet not in subnets:
+            # Grow the cap by one /24 so the local subnet doesn't push
+            # the default ranges out of the scan
+            subnets.insert(0, local_subnet)
+            max_ips += 254
+        elif local_subnet is not None:
+            subnets.remove(local_subnet)
+            subnets.insert(0, local_subnet)
+
+        for subnet in subnets:
             for i in range(1, 255):
                 ips_to_scan.append(f"{subnet}.{i}")
 
-        # Limit concurrent connections
-        semaphore = asyncio.Semaphore(50)
-
-        async def check_with_semaphore(ip: str) -> dict[str, Any] | None:
-            async with semaphore:
-                return await self._check_board(ip)
+        # Limit concurrent raw TCP probes; HTTP requests are throttled by the
+        # scan connector so discovery never competes with HA's shared pool
+        probe_semaphore = asyncio.BoundedSemaphore(DISCOVERY_CONCURRENCY)
+        connector = create_scan_connector(DISCOVERY_CONCURRENCY)
 
-        # Run discovery with limited concurrency
-        tasks = [check_with_semaphore(ip) for ip in ips_to_scan[:300]]  # Limit total IPs
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Boards that already have an entry would only abort on adoption
+        configured_ips = {
+            entry.data.get("ip_address") for entry in self._async_current_entries()
+        }
 
-        for result in results:
-            if isinstance(result, dict) and "mac_address" in result:
-                mac = result["mac_address"]
-                boards[mac] = result
-                _LOGGER.info("Discovered board: %s at %s", mac, result.get("ip_address"))
+        async def check_with_semaphore(
+            ip: str,
+            session: aiohttp.ClientSession,
+            out: dict[str, dict[str, Any]],
+        ) -> None:
+            async with probe_semaphore:
+                if not await probe_port(ip):
+                    return
+            info = await self._check_board(ip, session)
+            if info and "mac_address" in info:
+                out[info["mac_address"]] = info
+                _LOGGER.info("Discovered board: %s at %s", info["mac_address"], ip)
+
+        # Run discovery with limited concurrency; _check_board never raises
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=DISCOVERY_TIMEOUT),
+        ) as session:
+            await asyncio.gather(
+                *(
+                    check_with_semaphore(ip, session, boards)
+                    for ip in islice(ips_to_scan, max_ips)  # Limit total IPs
+                    if ip not in configured_ips
+                )
+            )
 
+        cache["boards"] = boards
+        cache["expires"] = loop.time() + DISCOVERY_CACHE_TTL
         return boards
 
-    async def _check_board(self, ip_address: str) -> dict[str, Any] | None:
+    async def _check_board(
+        self, ip_address: str, session: aiohttp.ClientSession | None = None
+    ) -> dict[str, Any] | None:
         """Check if a device at IP is an IR board."""
         try:
-            session = async_get_clientsession(self.hass)
+            if session is None:
+                session = async_get_clientsession(self.hass)
             async with asyncio.timeout(DISCOVERY_TIMEOUT):
-                async with session.get(f"http://{ip_address}/info") as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
+                async with session.get(
+                    f"http://{ip_address}/info",
+                    headers={"Accept": "application/json"},
+                ) as resp:
+                    # Skip routers, printers, etc. serving HTML on port 80
+                    if resp.status == 200 and resp.content_type == "application/json":
+                        data = json_loads(await resp.read())
                         if "board_id" in data and "mac_address" in data:
                             data["ip_address"] = ip_address
+                            data["default_board_id"] = _default_board_id(data)
                             return data
         except asyncio.TimeoutError:
             pass
@@ -311,7 +383,7 @@ class VdaIrControlConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     json={"board_id": board_id, "board_name": board_name},
                 ) as resp:
                     if resp.status == 200:
-                        result = await resp.json()
+                        result = json_loads(await resp.read())
                         return result.get("success", False)
         except Exception as err:
             _LOGGER.error("Failed to adopt board at %s: %s", ip_address, err)
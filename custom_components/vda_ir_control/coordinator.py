@@ -1,19 +1,152 @@
 """Data coordinator for VDA IR Control."""
 
 import asyncio
-import json
+import functools
 import logging
 import socket
-from typing import Any, Dict, Optional
+import struct
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
+import aiohttp
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 
-from .const import DOMAIN, ATTR_BOARD_ID, ATTR_IP_ADDRESS, ATTR_MAC_ADDRESS
+from .const import DOMAIN
+from .models import DiscoveredBoard
 
 _LOGGER = logging.getLogger(__name__)
 
+# Key under hass.data[DOMAIN] for the auto-detected local subnet
+SUBNET_CACHE_KEY = "local_subnet"
+
+# Headers for request bodies pre-serialized with json_bytes
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Shared request timeouts for board calls and discovery probes. The
+# separate socket-connect limit lets an offline board fail fast instead of
+# holding the caller for the whole request budget.
+BOARD_TIMEOUT = aiohttp.ClientTimeout(total=5, sock_connect=2)
+SCAN_TIMEOUT = aiohttp.ClientTimeout(total=2, sock_connect=0.5)
+
+# Seconds a /status response is reused for burst callers
+STATUS_CACHE_TTL = 0.5
+
+# Seconds to collect concurrent send_ir_code calls into one batch request
+SEND_BATCH_WINDOW = 0.005
+
+# /info capability advertised by firmware that serves /send_ir_batch
+BATCH_SEND_CAPABILITY = "send_ir_batch"
+
+# Batch endpoint statuses meaning the firmware does not support batching
+BATCH_UNSUPPORTED_STATUSES = (404, 405, 501)
+
+# Maximum bytes of an error response body included in log messages
+ERROR_BODY_LIMIT = 512
+
+# Raw TCP connect timeout used to skip dead hosts before any HTTP work
+PROBE_TIMEOUT = 0.25
+
+# SO_LINGER value that makes close() send RST instead of a FIN handshake
+LINGER_RESET = struct.pack("ii", 1, 0)
+
+# Maximum number of discovery probes in flight at once; also sizes the
+# scan connector, since every HTTP probe runs under the same limit
+SCAN_CONCURRENCY = 64
+
+
+@functools.lru_cache(maxsize=8)
+def _subnet_hosts(subnet: str) -> tuple:
+    """Return the host addresses .1 through .254 of a /24 subnet."""
+    return tuple(f"{subnet}.{i}" for i in range(1, 255))
+
+
+async def probe_port(ip_address: str, port: int = 80) -> bool:
+    """Return True if the host accepts a TCP connection on the given port."""
+    try:
+        _reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip_address, port), PROBE_TIMEOUT
+        )
+    except Exception:
+        return False
+
+    # Reset rather than close gracefully so a sweep leaves no
+    # TIME_WAIT sockets behind
+    sock = writer.get_extra_info("socket")
+    if sock is not None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RESET)
+    writer.close()
+    return True
+
+
+def create_scan_connector(limit: int) -> aiohttp.TCPConnector:
+    """Create a dedicated connector for sweeping a subnet for boards.
+
+    Every target is an IPv4 literal, which aiohttp connects to without
+    touching the resolver, so a DNS cache would only hold dead entries.
+    """
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=1,
+        use_dns_cache=False,
+        family=socket.AF_INET,
+    )
+
+
+def _get_local_subnet() -> Optional[str]:
+    """Get the local subnet that Home Assistant is running on."""
+    try:
+        # Connecting a UDP socket only selects the outbound route; no
+        # packet is sent, we just read back the local address chosen
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            local_ip = s.getsockname()[0]
+
+        # Extract subnet (first 3 octets)
+        parts = local_ip.split(".")
+        return ".".join(parts[:3])
+    except Exception as err:
+        _LOGGER.warning("Could not auto-detect subnet: %s", err)
+        return None
+
+
+async def async_get_local_subnet(hass: HomeAssistant) -> Optional[str]:
+    """Get the local subnet, detecting it once per Home Assistant run.
+
+    Returns None if the subnet could not be detected.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    subnet = domain_data.get(SUBNET_CACHE_KEY)
+    if subnet is None:
+        subnet = await hass.async_add_executor_job(_get_local_subnet)
+        if subnet is None:
+            return None
+        domain_data[SUBNET_CACHE_KEY] = subnet
+        _LOGGER.info("Auto-detected local subnet: %s", subnet)
+    return subnet
+
+
+async def _get_json(
+    session: aiohttp.ClientSession, url: str, timeout: aiohttp.ClientTimeout
+) -> Any:
+    """GET a URL and decode its JSON body, raising on any status but 200."""
+    async with session.get(url, timeout=timeout) as resp:
+        if resp.status != 200:
+            raise aiohttp.ClientResponseError(
+                resp.request_info, resp.history, status=resp.status
+            )
+        return json_loads(await resp.read())
+
+
+async def _read_error_body(resp: aiohttp.ClientResponse) -> str:
+    """Read the start of an error response body for logging."""
+    body = await resp.content.read(ERROR_BODY_LIMIT)
+    return body.decode(errors="replace")
+
 
 class VDAIRBoardCoordinator(DataUpdateCoordinator):
     """Coordinator for managing a single VDA IR board."""
@@ -38,27 +171,32 @@ class VDAIRBoardCoordinator(DataUpdateCoordinator):
         self.mac_address = mac_address
         self.port = port
         self.base_url = f"http://{ip_address}:{port}"
-        self.session = None
+        self._url_info = f"{self.base_url}/info"
+        self._url_send = f"{self.base_url}/send_ir"
+        self._url_test = f"{self.base_url}/test_output"
+        self._url_status = f"{self.base_url}/status"
+        self._url_send_batch = f"{self.base_url}/send_ir_batch"
+        self.session = async_get_clientsession(hass)
         self.board_info: Dict[str, Any] = {}
         self.ir_outputs: Dict[int, Dict[str, Any]] = {}
+        self._last_output_count = -1
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._status_lock = asyncio.Lock()
+        self._pending_sends: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        self._sends_in_flight = 0
+        # Off until the board advertises the batch endpoint in /info
+        self._batch_supported = False
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch board information."""
         try:
-            if self.session is None:
-                self.session = async_get_clientsession(self.hass)
-
-            async with self.session.get(
-                f"{self.base_url}/info",
-                timeout=5,
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    self.board_info = data
-                    self._parse_board_info(data)
-                    return data
-                else:
-                    raise UpdateFailed(f"Failed to get board info: {resp.status}")
+            data = await _get_json(self.session, self._url_info, BOARD_TIMEOUT)
+            self.board_info = data
+            self._parse_board_info(data)
+            return data
+        except aiohttp.ClientResponseError as err:
+            raise UpdateFailed(f"Failed to get board info: {err.status}") from err
         except asyncio.TimeoutError as err:
             raise UpdateFailed(f"Board {self.board_id} is unreachable") from err
         except Exception as err:
@@ -66,14 +204,27 @@ class VDAIRBoardCoordinator(DataUpdateCoordinator):
 
     def _parse_board_info(self, data: Dict[str, Any]) -> None:
         """Parse board info and extract IR outputs."""
-        # Build IR output information
+        capabilities = data.get("capabilities") or ()
+        self._batch_supported = (
+            isinstance(capabilities, (list, tuple))
+            and BATCH_SEND_CAPABILITY in capabilities
+        )
+
+        # Outputs are physical pins, so only rebuild when the count changes
         output_count = data.get("output_count", 0)
-        for i in range(1, output_count + 1):
-            self.ir_outputs[i] = {
+        if output_count == self._last_output_count:
+            return
+        self._last_output_count = output_count
+
+        # Build IR output information
+        self.ir_outputs = {
+            i: {
                 "output_id": i,
                 "name": f"Output {i}",
                 "unique_id": f"{self.board_id}_output_{i}",
             }
+            for i in range(1, output_count + 1)
+        }
 
     async def send_ir_code(self, output: int, code: str, protocol: str = None, raw_data: list = None, frequency: int = None) -> bool:
         """Send IR code to a specific output.
@@ -85,92 +236,205 @@ class VDAIRBoardCoordinator(DataUpdateCoordinator):
             raw_data: List of timing values in microseconds (for raw protocol)
             frequency: Carrier frequency in Hz (default 38000)
         """
+        payload = {
+            "output": output,
+            "code": code,
+        }
+        if protocol:
+            # Protocol names repeat on every send; share one string per name
+            payload["protocol"] = sys.intern(protocol.lower())
+        if raw_data:
+            payload["raw_data"] = raw_data
+        if frequency:
+            payload["frequency"] = frequency
+
+        # Send directly unless the board batches and other sends are
+        # already under way; a lone send never waits for the batch window
+        if not self._batch_supported or (
+            self._flush_task is None and not self._sends_in_flight
+        ):
+            self._sends_in_flight += 1
+            try:
+                return await self._send_single(payload)
+            finally:
+                self._sends_in_flight -= 1
+
+        # Queue the code so sends arriving within the batch window share a request
+        future = self.hass.loop.create_future()
+        self._pending_sends.append((payload, future))
+        if self._flush_task is None:
+            pending = self._pending_sends
+            self._flush_task = self.hass.async_create_task(self._async_flush_sends(pending))
+            self._flush_task.add_done_callback(
+                functools.partial(self._async_flush_done, pending)
+            )
+        return await future
+
+    async def _async_flush_sends(
+        self, pending: List[Tuple[Dict[str, Any], asyncio.Future]]
+    ) -> None:
+        """Send the IR codes queued during the batch window."""
+        await asyncio.sleep(SEND_BATCH_WINDOW)
+        # Later sends start a new batch
+        self._pending_sends = []
+        self._flush_task = None
+
+        results = None
+        if len(pending) > 1 and self._batch_supported:
+            results = await self._send_batch([payload for payload, _future in pending])
+        if results is not None:
+            for (_payload, future), result in zip(pending, results):
+                if not future.done():
+                    future.set_result(result)
+            return
+
+        # Single code, or the board does not support batching: send in order
+        for payload, future in pending:
+            result = await self._send_single(payload)
+            if not future.done():
+                future.set_result(result)
+
+    def _async_flush_done(
+        self, pending: List[Tuple[Dict[str, Any], asyncio.Future]], task: asyncio.Task
+    ) -> None:
+        """Report unsent codes as failed if the flush was cancelled or raised."""
+        if self._flush_task is task:
+            self._pending_sends = []
+            self._flush_task = None
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.error("Error sending IR codes to %s: %s", self.board_id, task.exception())
+        for _payload, future in pending:
+            if not future.done():
+                future.set_result(False)
+
+    async def _send_single(self, payload: Dict[str, Any]) -> bool:
+        """Send one IR code payload to /send_ir."""
         try:
-            if self.session is None:
-                self.session = async_get_clientsession(self.hass)
+            if await self._post_json(
+                self._url_send, payload, "Failed to send IR code to %s: %s", self.board_id
+            ):
+                _LOGGER.debug(
+                    "Successfully sent IR code to %s output %d",
+                    self.board_id,
+                    payload["output"],
+                )
+                return True
+            return False
+        except Exception as err:
+            _LOGGER.error("Error sending IR code: %s", err)
+            return False
 
-            payload = {
-                "output": output,
-                "code": code,
-            }
-            if protocol:
-                payload["protocol"] = protocol.lower()
-            if raw_data:
-                payload["raw_data"] = raw_data
-            if frequency:
-                payload["frequency"] = frequency
+    async def _send_batch(self, payloads: List[Dict[str, Any]]) -> Optional[List[bool]]:
+        """Send several IR code payloads in one request.
 
+        Returns one result per payload, or None if the board does not
+        support batching and the codes should be sent individually instead.
+        Any other failure reports every code as failed rather than resending,
+        since the board may already have transmitted some of them.
+        """
+        try:
             async with self.session.post(
-                f"{self.base_url}/send_ir",
-                json=payload,
-                timeout=5,
+                self._url_send_batch,
+                data=json_bytes({"commands": payloads}),
+                headers=JSON_HEADERS,
+                timeout=BOARD_TIMEOUT,
             ) as resp:
-                if resp.status == 200:
+                if resp.status in BATCH_UNSUPPORTED_STATUSES:
                     _LOGGER.debug(
-                        "Successfully sent IR code to %s output %d",
+                        "Board %s rejected batch endpoint (HTTP %d), sending IR codes individually",
                         self.board_id,
-                        output,
+                        resp.status,
                     )
-                    return True
-                else:
-                    _LOGGER.error(
-                        "Failed to send IR code to %s: %s",
-                        self.board_id,
-                        await resp.text(),
-                    )
-                    return False
+                    self._batch_supported = False
+                    return None
+                if resp.status != 200:
+                    if _LOGGER.isEnabledFor(logging.ERROR):
+                        _LOGGER.error(
+                            "Failed to send IR code batch to %s (HTTP %d: %s)",
+                            self.board_id,
+                            resp.status,
+                            await _read_error_body(resp),
+                        )
+                    return [False] * len(payloads)
+                body = await resp.read()
         except Exception as err:
-            _LOGGER.error("Error sending IR code: %s", err)
-            return False
+            _LOGGER.error("Error sending IR code batch to %s: %s", self.board_id, err)
+            return [False] * len(payloads)
+
+        # Firmware reports per-command results; without them every
+        # command in an accepted batch counts as sent
+        try:
+            results = json_loads(body).get("results") if body else None
+        except Exception:
+            results = None
+        if not isinstance(results, list) or len(results) != len(payloads):
+            results = [True] * len(payloads)
+        else:
+            results = [bool(result) for result in results]
+
+        _LOGGER.debug(
+            "Sent %d/%d IR codes to %s in one batch",
+            sum(results),
+            len(payloads),
+            self.board_id,
+        )
+        return results
 
     async def test_output(self, output: int, duration_ms: int = 500) -> bool:
         """Test an IR output by sending a test signal."""
         try:
-            if self.session is None:
-                self.session = async_get_clientsession(self.hass)
-
             payload = {
                 "output": output,
                 "duration_ms": duration_ms,
             }
 
-            async with self.session.post(
-                f"{self.base_url}/test_output",
-                json=payload,
-                timeout=5,
-            ) as resp:
-                if resp.status == 200:
-                    _LOGGER.debug(
-                        "Tested output %d on board %s",
-                        output,
-                        self.board_id,
-                    )
-                    return True
-                else:
-                    _LOGGER.error("Failed to test output: %s", await resp.text())
-                    return False
+            if await self._post_json(self._url_test, payload, "Failed to test output: %s"):
+                _LOGGER.debug(
+                    "Tested output %d on board %s",
+                    output,
+                    self.board_id,
+                )
+                return True
+            return False
         except Exception as err:
             _LOGGER.error("Error testing output: %s", err)
             return False
 
     async def get_board_status(self) -> Optional[Dict[str, Any]]:
         """Get current board status."""
-        try:
-            if self.session is None:
-                self.session = async_get_clientsession(self.hass)
-
-            async with self.session.get(
-                f"{self.base_url}/status",
-                timeout=5,
-            ) as resp:
-                if resp.status == 200:
-                    return await resp.json()
-                else:
-                    _LOGGER.error("Failed to get board status: %s", resp.status)
-                    return None
-        except Exception as err:
-            _LOGGER.error("Error getting board status: %s", err)
-            return None
+        cache = self._status_cache
+        if cache is not None and time.monotonic() - cache[0] < STATUS_CACHE_TTL:
+            return cache[1]
+
+        # Concurrent callers wait for one request instead of each sending their own
+        async with self._status_lock:
+            cache = self._status_cache
+            if cache is not None and time.monotonic() - cache[0] < STATUS_CACHE_TTL:
+                return cache[1]
+            try:
+                status = await _get_json(self.session, self._url_status, BOARD_TIMEOUT)
+            except aiohttp.ClientResponseError as err:
+                _LOGGER.error("Failed to get board status: %s", err.status)
+                return None
+            except Exception as err:
+                _LOGGER.error("Error getting board status: %s", err)
+                return None
+            self._status_cache = (time.monotonic(), status)
+            return status
+
+    async def _post_json(self, url: str, payload: Dict[str, Any], error_msg: str, *args: Any) -> bool:
+        """POST a JSON payload, logging error_msg with the response body on failure."""
+        async with self.session.post(
+            url,
+            data=json_bytes(payload),
+            headers=JSON_HEADERS,
+            timeout=BOARD_TIMEOUT,
+        ) as resp:
+            if resp.status == 200:
+                return True
+            if _LOGGER.isEnabledFor(logging.ERROR):
+                _LOGGER.error(error_msg, *args, await _read_error_body(resp))
+            return False
 
 
 class VDAIRDiscoveryCoordinator:
@@ -179,88 +443,114 @@ class VDAIRDiscoveryCoordinator:
     def __init__(self, hass: HomeAssistant):
         """Initialize the discovery coordinator."""
         self.hass = hass
-        self.session = None
-        self.discovered_boards: Dict[str, Dict[str, Any]] = {}
-
-    def _get_local_subnet(self) -> str:
-        """Get the local subnet that Home Assistant is running on."""
+        self.session = async_get_clientsession(hass)
+        self.discovered_boards: Dict[str, DiscoveredBoard] = {}
+        self._scan_sem = asyncio.Semaphore(SCAN_CONCURRENCY)
+
+    @staticmethod
+    def _candidate_ips() -> List[str]:
+        """Get IPv4 neighbours with a resolved MAC from the kernel ARP cache."""
+        candidates = []
         try:
-            # Create a socket to determine the local IP address
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            s.close()
-
-            # Extract subnet (first 3 octets)
-            parts = local_ip.split(".")
-            subnet = ".".join(parts[:3])
-            _LOGGER.info("Auto-detected local subnet: %s", subnet)
-            return subnet
-        except Exception as err:
-            _LOGGER.warning("Could not auto-detect subnet, using default: %s", err)
-            return "192.168.1"
-
-    async def discover_boards(self, subnet: str = None) -> Dict[str, Dict[str, Any]]:
+            with open("/proc/net/arp", encoding="ascii") as arp_file:
+                next(arp_file, None)  # Skip header
+                for line in arp_file:
+                    fields = line.split()
+                    # IP address, HW type, flags, HW address, mask, device
+                    if len(fields) >= 4 and fields[2] == "0x2":
+                        candidates.append(fields[0])
+        except OSError as err:
+            _LOGGER.debug("Could not read ARP cache: %s", err)
+        return candidates
+
+    async def discover_boards(self, subnet: str = None) -> Dict[str, DiscoveredBoard]:
         """Discover boards by scanning subnet. If subnet is None, auto-detects local subnet."""
         _LOGGER.info("Starting board discovery, subnet parameter: %s", subnet)
         boards = {}
 
-        if self.session is None:
-            self.session = async_get_clientsession(self.hass)
-
-        # Auto-detect subnet if not provided
+        # Auto-detect subnet if not provided, reading the ARP cache meanwhile
         if subnet is None:
-            subnet = self._get_local_subnet()
+            subnet, neighbours = await asyncio.gather(
+                async_get_local_subnet(self.hass),
+                self.hass.async_add_executor_job(self._candidate_ips),
+            )
+            if subnet is None:
+                subnet = "192.168.1"
+        else:
+            neighbours = await self.hass.async_add_executor_job(self._candidate_ips)
 
         _LOGGER.info("Scanning subnet: %s (will scan %s.1 through %s.254)", subnet, subnet, subnet)
 
-        # Scan common IP addresses in the subnet
-        tasks = []
+        # Use a dedicated connector so the scan neither queues behind nor
+        # starves Home Assistant's shared pool
+        connector = create_scan_connector(SCAN_CONCURRENCY)
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=SCAN_TIMEOUT,
+        ) as scan_session:
+            # Scan common IP addresses in the subnet
+            tasks = []
+
+            # Add specific test IPs first (for development/testing)
+            test_ips = ["192.168.4.87", "127.0.0.1"]
+
+            # Add hosts from the ARP cache so boards on other subnets that
+            # Home Assistant already talks to are found too
+            for ip in neighbours:
+                if ip not in test_ips and not ip.startswith(f"{subnet}."):
+                    test_ips.append(ip)
+
+            for ip in test_ips:
+                tasks.append(self._scan_ip(ip, scan_session))
+
+            # Scan a broader range to find all boards on the network
+            for ip in _subnet_hosts(subnet):
+                if ip not in test_ips:  # Don't duplicate
+                    tasks.append(self._scan_ip(ip, scan_session))
+
+            # Record boards as they answer instead of waiting for the
+            # slowest dead host to time out
+            _LOGGER.info("Created %d scan tasks, starting concurrent scan...", len(tasks))
+            self.discovered_boards = boards
+            for next_result in asyncio.as_completed(tasks):
+                result = await next_result
+                if result is not None:
+                    boards[result.mac_address] = result
+                    _LOGGER.info("Found board: %s at %s", result.board_id, result.ip_address)
 
-        # Add specific test IPs first (for development/testing)
-        test_ips = ["192.168.4.87", "127.0.0.1"]
-        for ip in test_ips:
-            tasks.append(self._check_board(ip))
-
-        # Scan a broader range to find all boards on the network
-        for i in range(1, 255):
-            ip = f"{subnet}.{i}"
-            if ip not in test_ips:  # Don't duplicate
-                tasks.append(self._check_board(ip))
-
-        _LOGGER.info("Created %d scan tasks, starting concurrent scan...", len(tasks))
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        _LOGGER.info("Scan completed, processing %d results...", len(results))
-
-        for result in results:
-            if isinstance(result, dict) and "mac_address" in result:
-                mac = result["mac_address"]
-                boards[mac] = result
-                _LOGGER.info("Found board: %s at %s", result.get("board_id"), result.get("ip_address"))
-
-        self.discovered_boards = boards
         _LOGGER.info("Discovery complete: found %d IR boards on network", len(boards))
         return boards
 
-    async def _check_board(self, ip_address: str) -> Optional[Dict[str, Any]]:
+    async def _scan_ip(
+        self, ip_address: str, session: aiohttp.ClientSession
+    ) -> Optional[DiscoveredBoard]:
+        """Query /info only if the host accepts a TCP connection on port 80."""
+        if await self._tcp_probe(ip_address) is None:
+            return None
+        return await self._check_board(ip_address, session)
+
+    async def _tcp_probe(self, ip_address: str, port: int = 80) -> Optional[str]:
+        """Return the IP if it accepts a TCP connection on the given port."""
+        async with self._scan_sem:
+            if await probe_port(ip_address, port):
+                return ip_address
+            return None
+
+    async def _check_board(
+        self, ip_address: str, session: Optional[aiohttp.ClientSession] = None
+    ) -> Optional[DiscoveredBoard]:
         """Check if a device at IP is an IR board."""
+        if session is None:
+            session = self.session
         try:
-            if self.session is None:
-                self.session = async_get_clientsession(self.hass)
-
-            async with self.session.get(
-                f"http://{ip_address}/info",
-                timeout=2,
-            ) as resp:
-                if resp.status == 200:
-                    data = await resp.json()
-                    # Verify it's an IR controller board
-                    if "board_id" in data and "mac_address" in data:
-                        data["ip_address"] = ip_address
-                        _LOGGER.info(f"Found IR board at {ip_address}: {data.get('board_id')}")
-                        return data
-                    else:
-                        _LOGGER.debug(f"Device at {ip_address} responded but missing board_id or mac_address")
+            async with self._scan_sem:
+                data = await _get_json(session, f"http://{ip_address}/info", SCAN_TIMEOUT)
+            # Verify it's an IR controller board
+            if "board_id" in data and "mac_address" in data:
+                _LOGGER.info(f"Found IR board at {ip_address}: {data.get('board_id')}")
+                return DiscoveredBoard.from_info(ip_address, data)
+            else:
+                _LOGGER.debug(f"Device at {ip_address} responded but missing board_id or mac_address")
         except asyncio.TimeoutError:
             _LOGGER.debug(f"Timeout checking {ip_address}")
         except Exception as err:
@@ -1,7 +1,9 @@
 """Device types and predefined command sets for IR devices."""
 
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, NamedTuple, Optional
+from types import MappingProxyType
+from typing import Dict, Final, Mapping, Optional, Tuple
 
 
 # Port modes
@@ -42,17 +44,21 @@ class LineEnding(str, Enum):
 
     def get_bytes(self) -> bytes:
         """Get the actual bytes for this line ending."""
-        endings = {
-            "none": b"",
-            "cr": b"\r",
-            "lf": b"\n",
-            "crlf": b"\r\n",
-            "!": b"!",
-        }
-        return endings.get(self.value, b"")
+        return LINE_ENDING_BYTES[self]
 
 
-class GPIOPin(NamedTuple):
+# Bytes appended to text commands for each line ending
+LINE_ENDING_BYTES: Final[Dict[LineEnding, bytes]] = {
+    LineEnding.NONE: b"",
+    LineEnding.CR: b"\r",
+    LineEnding.LF: b"\n",
+    LineEnding.CRLF: b"\r\n",
+    LineEnding.EXCLAMATION: b"!",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class GPIOPin:
     """GPIO pin definition for ESP32-POE-ISO board."""
     gpio: int
     name: str
@@ -67,7 +73,7 @@ class GPIOPin(NamedTuple):
 # Pins reserved for Ethernet: GPIO17, GPIO18, GPIO19, GPIO21, GPIO22, GPIO23, GPIO25, GPIO26, GPIO27
 # Pins shared with SD card (usable if no SD): GPIO2, GPIO14, GPIO15
 # Input-only pins: GPIO34, GPIO35, GPIO36, GPIO39
-ESP32_POE_ISO_PINS: Dict[int, GPIOPin] = {
+_ESP32_POE_ISO_PINS: Dict[int, GPIOPin] = {
     # FREE pins - output capable
     0: GPIOPin(0, "GPIO0", True, True, "FREE - Boot strapping, free after boot (WROOM only)", True),
     1: GPIOPin(1, "GPIO1", True, True, "FREE - USB programming, free after boot", True),
@@ -88,9 +94,10 @@ ESP32_POE_ISO_PINS: Dict[int, GPIOPin] = {
     36: GPIOPin(36, "GPIO36", True, False, "FREE - Input only, UEXT connector, 2.2k pull-up", True),
     39: GPIOPin(39, "GPIO39", True, False, "PWR SENSE - Input only, external power detection", True),
 }
+ESP32_POE_ISO_PINS: Final[Mapping[int, GPIOPin]] = MappingProxyType(_ESP32_POE_ISO_PINS)
 
 # Reserved pins (Ethernet) - NOT available for IR use
-ESP32_POE_ISO_RESERVED: Dict[int, str] = {
+_ESP32_POE_ISO_RESERVED: Dict[int, str] = {
     17: "EMAC_CLK - Ethernet clock (RMII)",
     18: "MDIO - Ethernet management data",
     19: "EMAC_TXD0 - Ethernet TX data 0",
@@ -101,43 +108,69 @@ ESP32_POE_ISO_RESERVED: Dict[int, str] = {
     26: "EMAC_RXD1 - Ethernet RX data 1",
     27: "EMAC_RX_DV - Ethernet RX data valid",
 }
+ESP32_POE_ISO_RESERVED: Final[Mapping[int, str]] = MappingProxyType(_ESP32_POE_ISO_RESERVED)
+
+# ESP32 exposes GPIO0 through GPIO39
+ESP32_GPIO_COUNT: Final = 40
+
+# One byte per GPIO number, 1 if reserved
+_RESERVED_BITMAP = bytes(gpio in ESP32_POE_ISO_RESERVED for gpio in range(ESP32_GPIO_COUNT))
+
+# Pin capabilities as flat columns in GPIO order for the filter helpers
+_PINS_SORTED = tuple(ESP32_POE_ISO_PINS[gpio] for gpio in sorted(ESP32_POE_ISO_PINS))
+_PIN_IR_CAPABLE = bytes(pin.ir_capable for pin in _PINS_SORTED)
+_PIN_CAN_INPUT = bytes(pin.can_input for pin in _PINS_SORTED)
+_PIN_CAN_OUTPUT = bytes(pin.can_output for pin in _PINS_SORTED)
+
 
+def _filter_ir_pins(for_input: bool, for_output: bool) -> Tuple[GPIOPin, ...]:
+    """Filter the pin table by IR capability, in GPIO order."""
+    return tuple(
+        _PINS_SORTED[i]
+        for i in range(len(_PINS_SORTED))
+        if _PIN_IR_CAPABLE[i]
+        and (not for_input or _PIN_CAN_INPUT[i])
+        and (not for_output or _PIN_CAN_OUTPUT[i])
+    )
 
-def get_available_ir_pins(for_input: bool = False, for_output: bool = False) -> List[GPIOPin]:
-    """Get list of GPIO pins available for IR use.
+
+# Every filter combination, indexed by (for_input << 1) | for_output
+_IR_PINS_ANY = _filter_ir_pins(False, False)
+_IR_PINS_OUT = _filter_ir_pins(False, True)
+_IR_PINS_IN = _filter_ir_pins(True, False)
+_IR_PINS_IN_OUT = _filter_ir_pins(True, True)
+_IR_PIN_SETS = (_IR_PINS_ANY, _IR_PINS_OUT, _IR_PINS_IN, _IR_PINS_IN_OUT)
+
+
+def get_available_ir_pins(for_input: bool = False, for_output: bool = False) -> Tuple[GPIOPin, ...]:
+    """Get GPIO pins available for IR use.
 
     Args:
         for_input: Filter for pins that can be used as IR input (receivers)
         for_output: Filter for pins that can be used as IR output (transmitters)
 
     Returns:
-        List of GPIOPin objects that match the criteria
+        Tuple of GPIOPin objects that match the criteria, ordered by GPIO
     """
-    pins = []
-    for gpio, pin in ESP32_POE_ISO_PINS.items():
-        if not pin.ir_capable:
-            continue
-        if for_input and not pin.can_input:
-            continue
-        if for_output and not pin.can_output:
-            continue
-        pins.append(pin)
-    return sorted(pins, key=lambda p: p.gpio)
+    return _IR_PIN_SETS[(bool(for_input) << 1) | bool(for_output)]
 
 
 def get_gpio_info(gpio: int) -> Optional[GPIOPin]:
     """Get information about a specific GPIO pin."""
-    return ESP32_POE_ISO_PINS.get(gpio)
+    return _ESP32_POE_ISO_PINS.get(gpio)
 
 
 def is_gpio_reserved(gpio: int) -> bool:
     """Check if a GPIO pin is reserved (e.g., for Ethernet)."""
-    return gpio in ESP32_POE_ISO_RESERVED
+    return 0 <= gpio < ESP32_GPIO_COUNT and _RESERVED_BITMAP[gpio] == 1
 
 
 def get_reserved_reason(gpio: int) -> Optional[str]:
-    """Get the reason a GPIO pin is reserved."""
-    return ESP32_POE_ISO_RESERVED.get(gpio)
+    """Get the reason a GPIO pin is reserved, or None if it is not reserved.
+
+    Use this alone instead of pairing it with is_gpio_reserved.
+    """
+    return _ESP32_POE_ISO_RESERVED.get(gpio)
 
 
 # Device types with their associated commands
@@ -159,8 +192,8 @@ class DeviceType(str, Enum):
 
 # Predefined command sets by device type
 # These are the standard command names that ensure consistency
-DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
-    DeviceType.CABLE_BOX: [
+_DEVICE_COMMANDS: Dict[DeviceType, Tuple[str, ...]] = {
+    DeviceType.CABLE_BOX: (
         # Power
         "power_on",
         "power_off",
@@ -209,9 +242,9 @@ DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
         # Page
         "page_up",
         "page_down",
-    ],
+    ),
 
-    DeviceType.TV: [
+    DeviceType.TV: (
         # Power
         "power_on",
         "power_off",
@@ -242,9 +275,9 @@ DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
         # Picture
         "picture_mode",
         "aspect_ratio",
-    ],
+    ),
 
-    DeviceType.AUDIO_RECEIVER: [
+    DeviceType.AUDIO_RECEIVER: (
         # Power
         "power_on",
         "power_off",
@@ -268,9 +301,9 @@ DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
         "bass_down",
         "treble_up",
         "treble_down",
-    ],
+    ),
 
-    DeviceType.STREAMING_DEVICE: [
+    DeviceType.STREAMING_DEVICE: (
         # Power
         "power_on",
         "power_off",
@@ -296,9 +329,9 @@ DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
         "mute",
         # Voice
         "voice",
-    ],
+    ),
 
-    DeviceType.DVD_BLURAY: [
+    DeviceType.DVD_BLURAY: (
         # Power
         "power_on",
         "power_off",
@@ -326,9 +359,9 @@ DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
         # Audio/Subtitle
         "audio_track",
         "subtitle",
-    ],
+    ),
 
-    DeviceType.PROJECTOR: [
+    DeviceType.PROJECTOR: (
         # Power
         "power_on",
         "power_off",
@@ -356,13 +389,13 @@ DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
         "exit",
         "freeze",
         "blank",
-    ],
+    ),
 
-    DeviceType.CUSTOM: [
+    DeviceType.CUSTOM: (
         # Empty - user defines all commands
-    ],
+    ),
 
-    DeviceType.HDMI_MATRIX: [
+    DeviceType.HDMI_MATRIX: (
         # Power
         "power_on",
         "power_off",
@@ -410,9 +443,9 @@ DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
         "cec_volume_up",
         "cec_volume_down",
         "cec_mute",
-    ],
+    ),
 
-    DeviceType.HDMI_SWITCH: [
+    DeviceType.HDMI_SWITCH: (
         # Power
         "power_on",
         "power_off",
@@ -426,9 +459,9 @@ DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
         # Query
         "query_status",
         "query_input",
-    ],
+    ),
 
-    DeviceType.AV_PROCESSOR: [
+    DeviceType.AV_PROCESSOR: (
         # Power
         "power_on",
         "power_off",
@@ -449,9 +482,9 @@ DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
         "query_status",
         "query_volume",
         "query_input",
-    ],
+    ),
 
-    DeviceType.SERIAL_RELAY: [
+    DeviceType.SERIAL_RELAY: (
         # Relay control
         "relay_1_on",
         "relay_1_off",
@@ -465,12 +498,15 @@ DEVICE_COMMANDS: Dict[DeviceType, List[str]] = {
         "all_off",
         # Query
         "query_status",
-    ],
+    ),
 }
 
+# Read-only public view; the lookup helpers read the backing dict directly
+DEVICE_COMMANDS: Final[Mapping[DeviceType, Tuple[str, ...]]] = MappingProxyType(_DEVICE_COMMANDS)
+
 
 # Human-readable labels for commands
-COMMAND_LABELS: Dict[str, str] = {
+_COMMAND_LABELS: Dict[str, str] = {
     # Power
     "power_on": "Power On",
     "power_off": "Power Off",
@@ -615,9 +651,16 @@ COMMAND_LABELS: Dict[str, str] = {
     "set_volume": "Set Volume",
 }
 
+# Fill in derived labels for any predefined command without an explicit one
+for _commands in DEVICE_COMMANDS.values():
+    for _command in _commands:
+        _COMMAND_LABELS.setdefault(_command, _command.replace("_", " ").title())
+del _commands, _command
+COMMAND_LABELS: Final[Mapping[str, str]] = MappingProxyType(_COMMAND_LABELS)
+
 
 # Device type labels
-DEVICE_TYPE_LABELS: Dict[DeviceType, str] = {
+_DEVICE_TYPE_LABELS: Dict[DeviceType, str] = {
     DeviceType.CABLE_BOX: "Cable/Satellite Box",
     DeviceType.TV: "Television",
     DeviceType.AUDIO_RECEIVER: "Audio Receiver/Soundbar",
@@ -630,18 +673,19 @@ DEVICE_TYPE_LABELS: Dict[DeviceType, str] = {
     DeviceType.SERIAL_RELAY: "Serial Relay Controller",
     DeviceType.CUSTOM: "Custom Device",
 }
+DEVICE_TYPE_LABELS: Final[Mapping[DeviceType, str]] = MappingProxyType(_DEVICE_TYPE_LABELS)
 
 
-def get_commands_for_device_type(device_type: DeviceType) -> List[str]:
-    """Get the list of commands available for a device type."""
-    return DEVICE_COMMANDS.get(device_type, [])
+def get_commands_for_device_type(device_type: DeviceType) -> Tuple[str, ...]:
+    """Get the commands available for a device type."""
+    return _DEVICE_COMMANDS.get(device_type, ())
 
 
 def get_command_label(command: str) -> str:
     """Get the human-readable label for a command."""
-    return COMMAND_LABELS.get(command, command.replace("_", " ").title())
+    return _COMMAND_LABELS.get(command) or command.replace("_", " ").title()
 
 
 def get_device_type_label(device_type: DeviceType) -> str:
     """Get the human-readable label for a device type."""
-    return DEVICE_TYPE_LABELS.get(device_type, device_type.value)
+    return _DEVICE_TYPE_LABELS.get(device_type) or device_type.value
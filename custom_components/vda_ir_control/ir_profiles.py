@@ -5,7 +5,8 @@ Use the sync feature to download profiles from:
 https://github.com/vda-solutions/vda-ir-profiles
 """
 
-from typing import Dict, List, Any
+import sys
+from typing import Dict, List, Any, Tuple
 
 # IR Profile structure:
 # {
@@ -22,37 +23,74 @@ from typing import Dict, List, Any
 # }
 
 # No builtin profiles - all profiles come from the community repository
-BUILTIN_PROFILES: List[Dict[str, Any]] = []
+BUILTIN_PROFILES: Tuple[Dict[str, Any], ...] = ()
 
 
-def get_all_profiles() -> List[Dict[str, Any]]:
-    """Return all built-in IR profiles."""
+# Lookup indexes over BUILTIN_PROFILES, built once at import
+_PROFILES_BY_ID: Dict[str, Dict[str, Any]] = {}
+_PROFILES_BY_TYPE: Dict[str, List[Dict[str, Any]]] = {}
+_PROFILES_BY_MANUFACTURER: Dict[str, List[Dict[str, Any]]] = {}
+
+
+def _index_profiles() -> None:
+    """Intern repeated profile strings and build the lookup indexes."""
+    for profile in BUILTIN_PROFILES:
+        # Intern the small set of repeated strings so code lookups by command
+        # name and protocol comparisons hit the identity fast path
+        profile["manufacturer"] = sys.intern(profile["manufacturer"])
+        if "protocol" in profile:
+            profile["protocol"] = sys.intern(profile["protocol"])
+        profile["codes"] = {
+            sys.intern(command): code for command, code in profile.get("codes", {}).items()
+        }
+
+        _PROFILES_BY_ID.setdefault(profile["profile_id"], profile)
+        _PROFILES_BY_TYPE.setdefault(profile["device_type"], []).append(profile)
+        _PROFILES_BY_MANUFACTURER.setdefault(
+            sys.intern(profile["manufacturer"].lower()), []
+        ).append(profile)
+
+
+_index_profiles()
+
+# Freeze the filtered groups so getters can return them without copying
+_PROFILES_BY_TYPE_FROZEN: Dict[str, Tuple[Dict[str, Any], ...]] = {
+    device_type: tuple(profiles) for device_type, profiles in _PROFILES_BY_TYPE.items()
+}
+_PROFILES_BY_MANUFACTURER_FROZEN: Dict[str, Tuple[Dict[str, Any], ...]] = {
+    manufacturer: tuple(profiles)
+    for manufacturer, profiles in _PROFILES_BY_MANUFACTURER.items()
+}
+
+_MANUFACTURERS: Tuple[str, ...] = tuple({p["manufacturer"] for p in BUILTIN_PROFILES})
+_DEVICE_TYPES: Tuple[str, ...] = tuple(_PROFILES_BY_TYPE)
+
+
+def get_all_profiles() -> Tuple[Dict[str, Any], ...]:
+    """Return all built-in IR profiles (shared, read-only)."""
     return BUILTIN_PROFILES
 
 
-def get_profiles_by_type(device_type: str) -> List[Dict[str, Any]]:
-    """Return profiles filtered by device type."""
-    return [p for p in BUILTIN_PROFILES if p["device_type"] == device_type]
+def get_profiles_by_type(device_type: str) -> Tuple[Dict[str, Any], ...]:
+    """Return profiles filtered by device type (shared, read-only)."""
+    return _PROFILES_BY_TYPE_FROZEN.get(device_type, ())
 
 
-def get_profiles_by_manufacturer(manufacturer: str) -> List[Dict[str, Any]]:
-    """Return profiles filtered by manufacturer."""
-    return [p for p in BUILTIN_PROFILES if p["manufacturer"].lower() == manufacturer.lower()]
+def get_profiles_by_manufacturer(manufacturer: str) -> Tuple[Dict[str, Any], ...]:
+    """Return profiles filtered by manufacturer (shared, read-only)."""
+    return _PROFILES_BY_MANUFACTURER_FROZEN.get(manufacturer.lower(), ())
 
 
 def get_profile_by_id(profile_id: str) -> Dict[str, Any] | None:
     """Return a specific profile by ID."""
-    for profile in BUILTIN_PROFILES:
-        if profile["profile_id"] == profile_id:
-            return profile
-    return None
+    return _PROFILES_BY_ID.get(profile_id)
 
 
-def get_available_manufacturers() -> List[str]:
-    """Return list of unique manufacturers."""
-    return list(set(p["manufacturer"] for p in BUILTIN_PROFILES))
+def get_available_manufacturers() -> Tuple[str, ...]:
+    """Return unique manufacturers (shared, read-only)."""
+    return _MANUFACTURERS
 
 
-def get_available_device_types() -> List[str]:
-    """Return list of unique device types."""
-    return list(set(p["device_type"] for p in BUILTIN_PROFILES))
+def get_available_device_types() -> Tuple[str, ...]:
+    """Return unique device types (shared, read-only)."""
+    return _DEVICE_TYPES
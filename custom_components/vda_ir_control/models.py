@@ -1,9 +1,9 @@
 """Data models for VDA IR Control."""
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
-from enum import Enum
+from typing import Any, Dict, List, Optional
 
 from .device_types import (
     DeviceType,
@@ -13,8 +13,13 @@ from .device_types import (
     LineEnding,
 )
 
+# Value -> member maps for enums decoded once per stored command; a
+# direct dict hit skips Enum.__call__ on the common (valid) path
+_COMMAND_FORMAT_BY_VALUE = CommandFormat._value2member_map_
+_LINE_ENDING_BY_VALUE = LineEnding._value2member_map_
 
-@dataclass
+
+@dataclass(slots=True)
 class PortConfig:
     """Configuration for a single port on a board."""
     port_number: int
@@ -40,7 +45,7 @@ class PortConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class BoardConfig:
     """Configuration for a board including all port mappings."""
     board_id: str
@@ -54,8 +59,7 @@ class BoardConfig:
     def __post_init__(self):
         # Initialize all ports if not provided
         if not self.ports:
-            for i in range(1, self.total_ports + 1):
-                self.ports[i] = PortConfig(port_number=i)
+            self.ports = {i: PortConfig(port_number=i) for i in range(1, self.total_ports + 1)}
 
     def get_ir_inputs(self) -> List[PortConfig]:
         """Get all ports configured as IR inputs."""
@@ -94,7 +98,40 @@ class BoardConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class DiscoveredBoard:
+    """A board found by a network discovery scan."""
+    mac_address: str
+    ip_address: str
+    board_id: str
+    board_name: Optional[str] = None
+    firmware_version: Optional[str] = None
+    output_count: Optional[int] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "mac_address": self.mac_address,
+            "ip_address": self.ip_address,
+            "board_id": self.board_id,
+            "board_name": self.board_name,
+            "firmware_version": self.firmware_version,
+            "output_count": self.output_count,
+        }
+
+    @classmethod
+    def from_info(cls, ip_address: str, data: dict) -> "DiscoveredBoard":
+        """Create from a board's /info response."""
+        return cls(
+            mac_address=data["mac_address"],
+            ip_address=ip_address,
+            board_id=data["board_id"],
+            board_name=data.get("board_name"),
+            firmware_version=data.get("firmware_version"),
+            output_count=data.get("output_count"),
+        )
+
+
+@dataclass(slots=True)
 class IRCode:
     """A single IR code for a command."""
     command: str  # e.g., "power_on", "channel_1"
@@ -112,15 +149,17 @@ class IRCode:
 
     @classmethod
     def from_dict(cls, data: dict) -> "IRCode":
+        # Command and protocol names repeat across every stored profile and
+        # match the predefined command sets; keep one shared copy of each
         return cls(
-            command=data["command"],
+            command=sys.intern(data["command"]),
             raw_code=data["raw_code"],
-            protocol=data.get("protocol", "raw"),
+            protocol=sys.intern(data.get("protocol", "raw")),
             frequency=data.get("frequency", 38000),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceProfile:
     """A device profile containing learned IR codes for a specific device model."""
     profile_id: str  # Unique ID, e.g., "xfinity_xr15_living_room"
@@ -162,7 +201,7 @@ class DeviceProfile:
         codes = {}
         if "codes" in data:
             for k, v in data["codes"].items():
-                codes[k] = IRCode.from_dict(v)
+                codes[sys.intern(k)] = IRCode.from_dict(v)
 
         return cls(
             profile_id=data["profile_id"],
@@ -174,7 +213,7 @@ class DeviceProfile:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlledDevice:
     """A device that is controlled via IR (e.g., a specific TV in a location)."""
     device_id: str  # Unique ID, e.g., "bar_tv_1"
@@ -221,7 +260,7 @@ class ControlledDevice:
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SerialConfig:
     """Configuration for serial communication."""
     port: str = ""                # /dev/ttyUSB0 for direct, board_id for bridge
@@ -266,7 +305,7 @@ class SerialConfig:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponsePattern:
     """Pattern to parse device responses for state updates."""
     pattern: str = ""             # Regex pattern to match (e.g., "input (\\d+) -> output (\\d+)")
@@ -292,7 +331,7 @@ class ResponsePattern:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceCommand:
     """A single command for a serial/network device."""
     command_id: str               # e.g., "power_on", "input_1"
@@ -334,12 +373,14 @@ class DeviceCommand:
             ResponsePattern.from_dict(p)
             for p in data.get("response_patterns", [])
         ]
+        fmt = data.get("format", "text")
+        line_ending = data.get("line_ending", "none")
         return cls(
             command_id=data["command_id"],
             name=data["name"],
-            format=CommandFormat(data.get("format", "text")),
+            format=_COMMAND_FORMAT_BY_VALUE.get(fmt) or CommandFormat(fmt),
             payload=data.get("payload", ""),
-            line_ending=LineEnding(data.get("line_ending", "none")),
+            line_ending=_LINE_ENDING_BY_VALUE.get(line_ending) or LineEnding(line_ending),
             protocol=data.get("protocol", ""),
             frequency=data.get("frequency", 38000),
             is_input_option=data.get("is_input_option", False),
@@ -350,7 +391,7 @@ class DeviceCommand:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceState:
     """Current state of a bidirectional device."""
     power: str = "unknown"        # on, off, unknown
@@ -402,7 +443,7 @@ class DeviceState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MatrixInput:
     """Configuration for a matrix input."""
     index: int
@@ -421,7 +462,7 @@ class MatrixInput:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class MatrixOutput:
     """Configuration for a matrix output."""
     index: int
@@ -440,7 +481,7 @@ class MatrixOutput:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SerialDevice:
     """A serial-controlled device (direct or via ESP32 bridge)."""
     device_id: str
@@ -8,17 +8,25 @@ Manages IR profiles from multiple sources:
 Priority order: User > Community > Built-in
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+import random
+import re
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import aiohttp
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.storage import Store
+from homeassistant.util.json import json_loads
 
 from .const import DOMAIN
-from .ir_profiles import BUILTIN_PROFILES, get_profile_by_id as get_builtin_profile
+from .ir_profiles import BUILTIN_PROFILES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +39,88 @@ GITHUB_RAW_BASE = "https://raw.githubusercontent.com/vda-solutions/vda-ir-profil
 GITHUB_API_BASE = "https://api.github.com/repos/vda-solutions/vda-ir-profiles"
 GITHUB_REPO_URL = "https://github.com/vda-solutions/vda-ir-profiles"
 
+# Maximum concurrent profile fetches while building the manifest listing
+MANIFEST_FETCH_CONCURRENCY = 16
+
+# Retries for GitHub rate-limit responses (403/429), and the longest
+# server-requested wait we are willing to sleep through before giving up
+GITHUB_MAX_RETRIES = 3
+GITHUB_MAX_RETRY_DELAY = 60
+
+# Relative repository path of a profile file, e.g. "tv/samsung/samsung_tv.json"
+PROFILE_PATH_PATTERN = re.compile(r"(?!.*\.\.)[A-Za-z0-9_][A-Za-z0-9_./-]*\.json")
+
+
+def _rate_limit_delay(resp: aiohttp.ClientResponse, attempt: int) -> Optional[float]:
+    """Return seconds to wait before retrying a throttled response.
+
+    Returns None when the response is not a rate-limit rejection.
+    """
+    if resp.status not in (403, 429):
+        return None
+
+    retry_after = resp.headers.get("Retry-After", "")
+    reset = resp.headers.get("X-RateLimit-Reset", "")
+    if retry_after.isdigit():
+        delay = float(retry_after)
+    elif resp.headers.get("X-RateLimit-Remaining") == "0" and reset.isdigit():
+        delay = max(0.0, int(reset) - time.time())
+    elif resp.status == 429:
+        delay = float(2 ** attempt)
+    else:
+        # Plain 403 without rate-limit headers is a real permission error
+        return None
+
+    return delay + random.uniform(0, 0.5)
+
+
+async def _github_get(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: Optional[Mapping[str, str]] = None,
+    timeout: float = 10,
+) -> Tuple[int, Optional[bytes], Mapping[str, str]]:
+    """GET a file from GitHub, backing off on rate limiting.
+
+    Returns:
+        Tuple of (HTTP status, body bytes or None, response headers)
+    """
+    attempt = 0
+    while True:
+        async with session.get(url, headers=headers, timeout=timeout) as resp:
+            if resp.status == 200:
+                return resp.status, await resp.read(), resp.headers
+
+            delay = _rate_limit_delay(resp, attempt)
+            if delay is None or attempt >= GITHUB_MAX_RETRIES or delay > GITHUB_MAX_RETRY_DELAY:
+                return resp.status, None, resp.headers
+
+        attempt += 1
+        _LOGGER.warning(
+            "GitHub rate limited %s (HTTP %d), retrying in %.1fs", url, resp.status, delay
+        )
+        await asyncio.sleep(delay)
+
+
+async def _github_get_json(
+    session: aiohttp.ClientSession,
+    url: str,
+    headers: Optional[Mapping[str, str]] = None,
+    timeout: float = 10,
+) -> Tuple[int, Any, Mapping[str, str]]:
+    """GET a JSON document from GitHub, backing off on rate limiting.
+
+    Returns:
+        Tuple of (HTTP status, parsed JSON or None, response headers)
+    """
+    status, body, resp_headers = await _github_get(session, url, headers, timeout)
+    return status, json_loads(body) if body is not None else None, resp_headers
+
+
+def _content_hash(body: bytes) -> str:
+    """Return a short content hash used to detect unchanged downloads."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
 
 class ProfileManager:
     """Manages IR profiles from multiple sources with priority."""
@@ -49,29 +139,95 @@ class ProfileManager:
         self._community_profiles: Dict[str, Dict[str, Any]] = {}
         self._meta: Dict[str, Any] = {}
         self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+        # Decorated (_source-tagged) profile lists, rebuilt on change
+        self._community_list_cache: Optional[Tuple[Dict[str, Any], ...]] = None
+        self._builtin_by_id: Optional[Dict[str, Dict[str, Any]]] = None
+        self._builtin_list_cache: Optional[Tuple[Dict[str, Any], ...]] = None
+        self._community_by_type: Optional[Dict[str, Tuple[Dict[str, Any], ...]]] = None
 
     async def async_load(self) -> None:
         """Load cached community profiles from storage."""
         if self._loaded:
             return
 
-        # Load community profiles cache
-        profiles_data = await self._community_store.async_load()
-        if profiles_data:
-            self._community_profiles = profiles_data
-            _LOGGER.debug("Loaded %d community profiles from cache", len(self._community_profiles))
-
-        # Load metadata (last sync time, etag, etc.)
-        meta_data = await self._meta_store.async_load()
-        if meta_data:
-            self._meta = meta_data
-
-        self._loaded = True
-        _LOGGER.info(
-            "ProfileManager loaded: %d community profiles, last sync: %s",
-            len(self._community_profiles),
-            self._meta.get("last_sync", "never")
+        # Concurrent first callers wait for a single storage read
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            # Load community profiles cache
+            profiles_data = await self._community_store.async_load()
+            if profiles_data:
+                self._community_profiles = profiles_data
+                self._community_list_cache = None
+                self._community_by_type = None
+                _LOGGER.debug("Loaded %d community profiles from cache", len(self._community_profiles))
+
+            # Load metadata (last sync time, etag, etc.)
+            meta_data = await self._meta_store.async_load()
+            if meta_data:
+                self._meta = meta_data
+
+            self._loaded = True
+            _LOGGER.info(
+                "ProfileManager loaded: %d community profiles, last sync: %s",
+                len(self._community_profiles),
+                self._meta.get("last_sync", "never")
+            )
+
+    async def _async_get_manifest(
+        self,
+        session: aiohttp.ClientSession,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[int, Optional[Dict[str, Any]], bool]:
+        """Fetch the manifest, revalidating the cached copy if we have one.
+
+        Sends both If-None-Match and If-Modified-Since so a 304 is still
+        possible when one of the validators is missing. A 200 whose body
+        hashes the same as the cached copy is also reported as unchanged.
+
+        Returns:
+            Tuple of (HTTP status, manifest dict or None, unchanged flag)
+        """
+        manifest_url = f"{GITHUB_RAW_BASE}/manifest.json"
+        _LOGGER.debug("Fetching manifest from %s", manifest_url)
+
+        request_headers = dict(headers or {})
+        cached = self._meta.get("manifest")
+        if cached is not None:
+            if etag := self._meta.get("manifest_etag"):
+                request_headers["If-None-Match"] = etag
+            if last_modified := self._meta.get("manifest_last_modified"):
+                request_headers["If-Modified-Since"] = last_modified
+
+        status, body, resp_headers = await _github_get(
+            session, manifest_url, headers=request_headers, timeout=30
         )
+        if status == 304 and cached is not None:
+            _LOGGER.debug("Manifest not modified, using cached copy")
+            return 200, cached, True
+
+        if status != 200:
+            return status, None, False
+
+        manifest_hash = _content_hash(body)
+        if cached is not None and self._meta.get("manifest_hash") == manifest_hash:
+            _LOGGER.debug("Manifest content unchanged, using cached copy")
+            unchanged = True
+            manifest = cached
+        else:
+            # Parse before recording validators so a malformed body is never
+            # revalidated into a 304 against the stale cached copy
+            manifest = json_loads(body)
+            unchanged = False
+
+        self._meta["manifest"] = manifest
+        self._meta["manifest_hash"] = manifest_hash
+        self._meta["manifest_etag"] = resp_headers.get("ETag")
+        self._meta["manifest_last_modified"] = resp_headers.get("Last-Modified")
+        return 200, manifest, unchanged
 
     async def async_fetch_manifest(self) -> Dict[str, Any]:
         """Fetch the manifest (list of available profiles) from GitHub.
@@ -81,6 +237,7 @@ class ProfileManager:
         Returns:
             Dict with manifest data including available profiles list
         """
+        await self.async_load()
         session = async_get_clientsession(self.hass)
 
         headers = {
@@ -95,31 +252,85 @@ class ProfileManager:
         }
 
         try:
-            manifest_url = f"{GITHUB_RAW_BASE}/manifest.json"
-            _LOGGER.debug("Fetching manifest from %s", manifest_url)
-
-            async with session.get(manifest_url, headers=headers, timeout=30) as resp:
-                if resp.status == 404:
-                    result["message"] = "Community profile repository not found"
-                    _LOGGER.error("Manifest not found at %s", manifest_url)
-                    return result
-
-                if resp.status != 200:
-                    result["message"] = f"GitHub error: HTTP {resp.status}"
-                    _LOGGER.error("Failed to fetch manifest: HTTP %d", resp.status)
-                    return result
+            status, manifest, unchanged = await self._async_get_manifest(session, headers)
+            if status == 404:
+                result["message"] = "Community profile repository not found"
+                _LOGGER.error("Manifest not found at %s/manifest.json", GITHUB_RAW_BASE)
+                return result
 
-                manifest = await resp.json(content_type=None)
+            if status != 200:
+                result["message"] = f"GitHub error: HTTP {status}"
+                _LOGGER.error("Failed to fetch manifest: HTTP %d", status)
+                return result
 
             # Parse manifest and extract profile metadata
             # The manifest can have two formats:
             # 1. Simple: {"profiles": ["path/to/profile.json", ...]}
             # 2. Detailed: {"profiles": [{"id": "...", "name": "...", "path": "...", ...}, ...]}
-            profiles_raw = manifest.get("profiles", [])
+            profiles_raw = [
+                item for item in manifest.get("profiles", [])
+                if isinstance(item, dict)
+                or (isinstance(item, str) and PROFILE_PATH_PATTERN.fullmatch(item))
+            ]
+            rejected = len(manifest.get("profiles", [])) - len(profiles_raw)
+            if rejected:
+                _LOGGER.warning("Ignoring %d malformed manifest entries", rejected)
             available_profiles = []
 
             _LOGGER.info("Fetching command counts for %d profiles", len(profiles_raw))
 
+            sem = asyncio.Semaphore(MANIFEST_FETCH_CONCURRENCY)
+            profile_etags: Dict[str, str] = self._meta.setdefault("profile_etags", {})
+            cached_counts: Dict[str, int] = self._meta.setdefault("profile_command_counts", {})
+
+            async def _fetch_command_count(path: str, profile_id: str) -> Optional[int]:
+                """Fetch a profile file and return its command count.
+
+                Sends the ETag from the previous fetch so unchanged profiles
+                come back as 304 and reuse the cached count.
+                """
+                request_headers = dict(headers)
+                etag = profile_etags.get(path)
+                if etag and path in cached_counts:
+                    request_headers["If-None-Match"] = etag
+
+                async with sem:
+                    try:
+                        profile_url = f"{GITHUB_RAW_BASE}/{path}"
+                        status, profile_data, resp_headers = await _github_get_json(
+                            session, profile_url, headers=request_headers, timeout=5
+                        )
+                        if status == 304:
+                            return cached_counts.get(path)
+                        if status == 200:
+                            codes = profile_data.get("codes", {})
+                            _LOGGER.debug("Profile %s has %d commands", profile_id, len(codes))
+                            cached_counts[path] = len(codes)
+                            if new_etag := resp_headers.get("ETag"):
+                                profile_etags[path] = new_etag
+                            return len(codes)
+                    except Exception as err:
+                        _LOGGER.warning("Failed to fetch command count for %s: %s", profile_id, err)
+                return None
+
+            # Fetch command counts for simple-format entries concurrently.
+            # An unchanged manifest with every count cached skips the
+            # per-profile requests entirely.
+            simple_items = [item for item in profiles_raw if isinstance(item, str)]
+            if unchanged and all(item in cached_counts for item in simple_items):
+                command_counts = {item: cached_counts[item] for item in simple_items}
+            else:
+                simple_ids = [item.split("/")[-1].replace(".json", "") for item in simple_items]
+                counts = await asyncio.gather(
+                    *(_fetch_command_count(item, pid) for item, pid in zip(simple_items, simple_ids))
+                )
+                command_counts = dict(zip(simple_items, counts))
+
+            # Drop validators for profiles no longer listed in the manifest
+            for stale in (profile_etags.keys() | cached_counts.keys()) - command_counts.keys():
+                profile_etags.pop(stale, None)
+                cached_counts.pop(stale, None)
+
             for item in profiles_raw:
                 if isinstance(item, str):
                     # Simple format - just a path
@@ -131,19 +342,6 @@ class ProfileManager:
                     device_type = parts[0] if len(parts) > 0 else "unknown"
                     manufacturer = parts[1] if len(parts) > 1 else "Unknown"
 
-                    # Fetch actual command count from the profile file
-                    command_count = None
-                    try:
-                        profile_url = f"{GITHUB_RAW_BASE}/{item}"
-                        async with session.get(profile_url, timeout=5) as profile_resp:
-                            if profile_resp.status == 200:
-                                profile_data = await profile_resp.json(content_type=None)
-                                codes = profile_data.get("codes", {})
-                                command_count = len(codes)
-                                _LOGGER.debug("Profile %s has %d commands", profile_id, command_count)
-                    except Exception as err:
-                        _LOGGER.warning("Failed to fetch command count for %s: %s", profile_id, err)
-
                     available_profiles.append({
                         "profile_id": profile_id,
                         "path": item,
@@ -151,13 +349,14 @@ class ProfileManager:
                         "manufacturer": manufacturer.replace("_", " ").title(),
                         "device_type": device_type,
                         "downloaded": False,
-                        "command_count": command_count,
+                        "command_count": command_counts.get(item),
                     })
                 elif isinstance(item, dict):
-                    # Detailed format - has metadata
-                    if "downloaded" not in item:
-                        item["downloaded"] = False
-                    available_profiles.append(item)
+                    # Detailed format - has metadata. Copy it so callers
+                    # marking "downloaded" don't touch the cached manifest.
+                    entry = dict(item)
+                    entry.setdefault("downloaded", False)
+                    available_profiles.append(entry)
 
             result["success"] = True
             result["available_profiles"] = available_profiles
@@ -198,12 +397,10 @@ class ProfileManager:
 
         try:
             # First fetch manifest to find the profile path
-            manifest_url = f"{GITHUB_RAW_BASE}/manifest.json"
-            async with session.get(manifest_url, timeout=30) as resp:
-                if resp.status != 200:
-                    result["message"] = f"Failed to fetch manifest: HTTP {resp.status}"
-                    return result
-                manifest = await resp.json(content_type=None)
+            status, manifest, _ = await self._async_get_manifest(session)
+            if status != 200:
+                result["message"] = f"Failed to fetch manifest: HTTP {status}"
+                return result
 
             # Find the profile path in manifest
             profile_path = None
@@ -227,20 +424,37 @@ class ProfileManager:
                 result["message"] = f"Profile {profile_id} not found in manifest"
                 return result
 
+            if not PROFILE_PATH_PATTERN.fullmatch(profile_path):
+                result["message"] = f"Invalid profile path in manifest: {profile_path}"
+                return result
+
             # Download the profile
             profile_url = f"{GITHUB_RAW_BASE}/{profile_path}"
             _LOGGER.debug("Downloading profile from %s", profile_url)
 
-            async with session.get(profile_url, timeout=10) as profile_resp:
-                if profile_resp.status != 200:
-                    result["message"] = f"Failed to download profile: HTTP {profile_resp.status}"
-                    return result
-
-                profile_data = await profile_resp.json(content_type=None)
+            status, body, _ = await _github_get(session, profile_url, timeout=10)
+            if status != 200:
+                result["message"] = f"Failed to download profile: HTTP {status}"
+                return result
 
-            # Save to storage
-            self._community_profiles[profile_id] = profile_data
-            await self._community_store.async_save(self._community_profiles)
+            # Skip parsing and the full storage rewrite when the body is
+            # byte-identical to what we already have
+            profile_hashes: Dict[str, str] = self._meta.setdefault("profile_hashes", {})
+            body_hash = _content_hash(body)
+            if (
+                profile_id in self._community_profiles
+                and profile_hashes.get(profile_id) == body_hash
+            ):
+                _LOGGER.debug("Profile %s unchanged, skipping storage write", profile_id)
+                profile_data = self._community_profiles[profile_id]
+            else:
+                profile_data = json_loads(body)
+                self._community_profiles[profile_id] = profile_data
+                self._community_list_cache = None
+                self._community_by_type = None
+                profile_hashes[profile_id] = body_hash
+                await self._community_store.async_save(self._community_profiles)
+                await self._meta_store.async_save(self._meta)
 
             result["success"] = True
             result["profile"] = profile_data
@@ -275,6 +489,9 @@ class ProfileManager:
             return result
 
         del self._community_profiles[profile_id]
+        self._meta.get("profile_hashes", {}).pop(profile_id, None)
+        self._community_list_cache = None
+        self._community_by_type = None
         await self._community_store.async_save(self._community_profiles)
 
         result["success"] = True
@@ -292,9 +509,9 @@ class ProfileManager:
         Returns:
             Profile dict with _source field, or None if not found
         """
-        profile = get_builtin_profile(profile_id)
+        profile = self._get_builtin_by_id().get(profile_id)
         if profile:
-            return {**profile, "_source": "builtin"}
+            return dict(profile)
         return None
 
     def get_community_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
@@ -338,27 +555,62 @@ class ProfileManager:
         # Fall back to built-in
         return self.get_builtin_profile(profile_id)
 
-    def get_all_community_profiles(self) -> List[Dict[str, Any]]:
+    def get_all_community_profiles(self) -> Tuple[Dict[str, Any], ...]:
         """Get all cached community profiles.
 
+        The returned tuple is shared between calls; treat it as read-only.
+
         Returns:
-            List of profile dicts with _source field
+            Tuple of profile dicts with _source field
         """
-        return [
-            {**profile, "_source": "community"}
-            for profile in self._community_profiles.values()
-        ]
+        if self._community_list_cache is None:
+            self._community_list_cache = tuple(
+                {**profile, "_source": "community"}
+                for profile in self._community_profiles.values()
+            )
+        return self._community_list_cache
 
-    def get_all_builtin_profiles(self) -> List[Dict[str, Any]]:
+    def get_community_profiles_by_type(self, device_type: str) -> Tuple[Dict[str, Any], ...]:
+        """Get cached community profiles of a given device type.
+
+        Args:
+            device_type: The device type to filter by
+
+        Returns:
+            Tuple of profile dicts with _source field
+        """
+        if self._community_by_type is None:
+            by_type: Dict[str, List[Dict[str, Any]]] = {}
+            for profile in self.get_all_community_profiles():
+                by_type.setdefault(profile.get("device_type"), []).append(profile)
+            self._community_by_type = {
+                dtype: tuple(profiles) for dtype, profiles in by_type.items()
+            }
+        return self._community_by_type.get(device_type, ())
+
+    def _get_builtin_by_id(self) -> Dict[str, Dict[str, Any]]:
+        """Return built-in profiles tagged with _source, keyed by ID.
+
+        Built-in profiles never change at runtime, so this is built once.
+        """
+        if self._builtin_by_id is None:
+            self._builtin_by_id = {
+                profile["profile_id"]: {**profile, "_source": "builtin"}
+                for profile in BUILTIN_PROFILES
+            }
+        return self._builtin_by_id
+
+    def get_all_builtin_profiles(self) -> Tuple[Dict[str, Any], ...]:
         """Get all built-in profiles.
 
+        The returned tuple is shared between calls; treat it as read-only.
+
         Returns:
-            List of profile dicts with _source field
+            Tuple of profile dicts with _source field
         """
-        return [
-            {**profile, "_source": "builtin"}
-            for profile in BUILTIN_PROFILES
-        ]
+        if self._builtin_list_cache is None:
+            self._builtin_list_cache = tuple(self._get_builtin_by_id().values())
+        return self._builtin_list_cache
 
     def get_sync_status(self) -> Dict[str, Any]:
         """Get sync status information.
@@ -435,7 +687,8 @@ def get_profile_manager(hass: HomeAssistant) -> ProfileManager:
     Returns:
         ProfileManager instance (singleton per HA instance)
     """
-    if "profile_manager" not in hass.data.get(DOMAIN, {}):
-        hass.data.setdefault(DOMAIN, {})
-        hass.data[DOMAIN]["profile_manager"] = ProfileManager(hass)
-    return hass.data[DOMAIN]["profile_manager"]
+    domain_data: Dict[str, Any] = hass.data.setdefault(DOMAIN, {})
+    manager = domain_data.get("profile_manager")
+    if manager is None:
+        manager = domain_data["profile_manager"] = ProfileManager(hass)
+    return manager
@@ -1,20 +1,20 @@
 """Coordinator for bidirectional serial device communication."""
 
 import asyncio
+import functools
 import logging
 import re
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import DOMAIN
-from .device_types import CommandFormat, LineEnding
+from .device_types import LINE_ENDING_BYTES, CommandFormat, LineEnding
 from .models import (
     SerialDevice,
-    SerialConfig,
     DeviceCommand,
     DeviceState,
     ResponsePattern,
@@ -23,13 +23,27 @@ from .models import (
 _LOGGER = logging.getLogger(__name__)
 
 # Line ending mappings
-LINE_ENDINGS = {
-    LineEnding.NONE: b"",
-    LineEnding.CR: b"\r",
-    LineEnding.LF: b"\n",
-    LineEnding.CRLF: b"\r\n",
-    LineEnding.EXCLAMATION: b"!",
-}
+LINE_ENDINGS = LINE_ENDING_BYTES
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a response pattern once; every incoming line is matched against it."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_payload(fmt: CommandFormat, payload: str, line_ending: LineEnding) -> bytes:
+    """Encode a command payload to wire bytes once per distinct command."""
+    if fmt == CommandFormat.HEX:
+        # Convert hex string to bytes
+        data = bytes.fromhex(payload.replace(" ", ""))
+    else:
+        # Text command
+        data = payload.encode("utf-8")
+
+    # Add line ending
+    return data + LINE_ENDINGS.get(line_ending, b"")
 
 
 class SerialDeviceCoordinator(DataUpdateCoordinator[DeviceState]):
@@ -325,7 +339,7 @@ class SerialDeviceCoordinator(DataUpdateCoordinator[DeviceState]):
             return False
 
         try:
-            match = re.search(pattern.pattern, response, re.IGNORECASE)
+            match = _compile_pattern(pattern.pattern).search(response)
             if match:
                 value = match.group(pattern.value_group)
 
@@ -415,16 +429,7 @@ class SerialDeviceCoordinator(DataUpdateCoordinator[DeviceState]):
 
     def _build_payload(self, command: DeviceCommand) -> bytes:
         """Build the payload bytes from a command."""
-        if command.format == CommandFormat.HEX:
-            # Convert hex string to bytes
-            payload = bytes.fromhex(command.payload.replace(" ", ""))
-        else:
-            # Text command
-            payload = command.payload.encode("utf-8")
-
-        # Add line ending
-        line_ending = LINE_ENDINGS.get(command.line_ending, b"")
-        return payload + line_ending
+        return _encode_payload(command.format, command.payload, command.line_ending)
 
     async def _send_direct(
         self,
@@ -438,7 +443,7 @@ class SerialDeviceCoordinator(DataUpdateCoordinator[DeviceState]):
 
         # Set up response future if waiting
         if wait_for_response:
-            self._pending_response = asyncio.Future()
+            self._pending_response = self.hass.loop.create_future()
 
         try:
             self._writer.write(payload)
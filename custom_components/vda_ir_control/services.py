@@ -272,17 +272,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         boards = await discovery.discover_boards(subnet)
 
         result = {
-            "discovered_boards": [
-                {
-                    "mac_address": mac,
-                    "ip_address": info.get("ip_address"),
-                    "board_id": info.get("board_id"),
-                    "board_name": info.get("board_name"),
-                    "firmware_version": info.get("firmware_version"),
-                    "output_count": info.get("output_count"),
-                }
-                for mac, info in boards.items()
-            ],
+            "discovered_boards": [board.to_dict() for board in boards.values()],
             "total_found": len(boards),
         }
 